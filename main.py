@@ -1,12 +1,31 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from pydantic import BaseModel, HttpUrl
+from collections import deque
+from contextlib import asynccontextmanager
+
+import asyncio
+
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+from fastapi.responses import ORJSONResponse
 import httpx
+import msgspec
+import orjson
 import os
-from typing import Dict, Any
+import re
+import tempfile
+from typing import Dict, Any, Optional
+from urllib.parse import unquote, urlparse
 import logging
 from dotenv import load_dotenv
 import boto3
-from botocore.exceptions import NoCredentialsError, BotoCoreError
+from botocore.config import Config
+from botocore.exceptions import NoCredentialsError, BotoCoreError, ClientError
+from arq import create_pool
+from arq.connections import RedisSettings
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 # Load environment variables from .env file
 load_dotenv()
@@ -15,7 +34,60 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Dromo Headless Import API", version="1.0.0")
+
+# HTTP connection pool tuning (sized for concurrent import + webhook traffic)
+DROMO_MAX_CONNECTIONS = int(os.getenv("DROMO_MAX_CONNECTIONS", "200"))
+DROMO_KEEPALIVE = int(os.getenv("DROMO_KEEPALIVE", "50"))
+DROMO_KEEPALIVE_EXPIRY = float(os.getenv("DROMO_KEEPALIVE_EXPIRY", "60.0"))
+
+# Optional Redis broker for offloading webhook processing to an arq worker
+REDIS_URL = os.getenv("REDIS_URL")
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """
+    Build the pooled HTTP client shared by the app (and the arq worker).
+    """
+    limits = httpx.Limits(
+        max_connections=DROMO_MAX_CONNECTIONS,
+        max_keepalive_connections=DROMO_KEEPALIVE,
+        keepalive_expiry=DROMO_KEEPALIVE_EXPIRY,
+    )
+    logger.info(
+        f"HTTP pool limits: max_connections={limits.max_connections}, "
+        f"max_keepalive_connections={limits.max_keepalive_connections}, "
+        f"keepalive_expiry={limits.keepalive_expiry}s"
+    )
+    # HTTP/2 multiplexes the create-import POST, file PUT and webhook
+    # downloads over a single TLS connection to app.dromo.io; hosts that
+    # don't support it (e.g. presigned S3 URLs) fall back to HTTP/1.1.
+    # The license-key header is deliberately NOT a client default: the
+    # same client also talks to presigned third-party hosts
+    return httpx.AsyncClient(limits=limits, timeout=30.0, http2=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shared HTTP client so all handlers reuse pooled connections to Dromo
+    # instead of paying a TCP+TLS handshake per request
+    app.state.http = build_http_client()
+    # Job queue for webhook processing; handled inline when Redis isn't
+    # configured (e.g. local dev)
+    app.state.arq = (
+        await create_pool(RedisSettings.from_dsn(REDIS_URL)) if REDIS_URL else None
+    )
+    yield
+    if app.state.arq is not None:
+        await app.state.arq.close()
+    await app.state.http.aclose()
+
+
+app = FastAPI(
+    title="Dromo Headless Import API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Configuration
 DROMO_API_BASE = "https://app.dromo.io/api/v1"
@@ -30,32 +102,260 @@ AWS_S3_BUCKET = os.getenv("AWS_S3_BUCKET")
 if not DROMO_LICENSE_KEY:
     logger.warning("DROMO_LICENSE_KEY environment variable not set")
 
+# Static Dromo auth header, built once at startup and passed explicitly
+# on Dromo API calls only - never on presigned S3 transfers, which go
+# through the same client but must not see the license key
+_DROMO_HEADERS = {"X-Dromo-License-Key": DROMO_LICENSE_KEY or ""}
+
 if not all([AWS_ACCESS_KEY, AWS_SECRET_KEY, AWS_S3_BUCKET]):
     logger.warning("AWS credentials or S3 bucket not configured")
 
-# Initialize S3 client
+# Initialize S3 client once at import with a pinned config: the pool is
+# sized for parallel ranged GETs and multipart parts, keepalive avoids
+# re-handshaking between calls, and adaptive retries absorb throttling
 s3_client = boto3.client(
     's3',
     aws_access_key_id=AWS_ACCESS_KEY,
-    aws_secret_access_key=AWS_SECRET_KEY
+    aws_secret_access_key=AWS_SECRET_KEY,
+    config=Config(
+        max_pool_connections=50,
+        retries={'max_attempts': 5, 'mode': 'adaptive'},
+        tcp_keepalive=True,
+        connect_timeout=3,
+        read_timeout=30,
+    )
 )
 
 
-class FileImportRequest(BaseModel):
+# Candidate keys Dromo may return the upload URL under; the one that
+# matches is discovered on the first successful import and memoized in
+# _UPLOAD_KEY (the response schema is fixed per deployment)
+_UPLOAD_KEYS = ("upload_url", "upload", "uploadUrl", "file_upload_url")
+_UPLOAD_KEY: Optional[str] = None
+
+# Transient failures worth retrying locally instead of surfacing to the
+# caller (and, for webhooks, instead of waiting on Dromo's redelivery)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, (httpx.TransportError, BotoCoreError))
+
+
+# Applied only to idempotent calls (GETs, HEADs, part uploads) so a retry
+# can never duplicate a side effect
+_transient_retry = retry(
+    stop=stop_after_attempt(4),
+    wait=wait_random_exponential(multiplier=0.1, max=2),
+    retry=retry_if_exception(_is_transient_error),
+    reraise=True,
+)
+
+
+@_transient_retry
+async def _s3_call(fn, **kwargs):
+    """Run an idempotent boto3 call in a worker thread with retry."""
+    return await asyncio.to_thread(fn, **kwargs)
+
+
+@_transient_retry
+async def _get_with_retry(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    """GET with retry on transient transport errors and 5xx/429 responses."""
+    response = await client.get(url, **kwargs)
+    response.raise_for_status()
+    return response
+
+
+# Per-call timeouts: control-plane JSON calls should fail fast so hung
+# sockets don't pin workers, while file transfers may legitimately run
+# for minutes and only bound connect/pool acquisition
+CONTROL_TIMEOUT = httpx.Timeout(connect=3.0, read=10.0, write=10.0, pool=5.0)
+TRANSFER_TIMEOUT = httpx.Timeout(connect=3.0, read=None, write=None, pool=5.0)
+
+# Chunk size for streaming transfers between S3 and Dromo
+STREAM_CHUNK_SIZE = 1 << 20  # 1 MB
+
+# Objects at or above this size are downloaded via parallel ranged GETs,
+# which push past the ~90 MiB/s ceiling of a single S3 connection
+RANGED_DOWNLOAD_THRESHOLD = 32 << 20  # 32 MB
+RANGED_CHUNK_SIZE = 16 << 20  # 16 MB per ranged GET
+RANGED_CONCURRENCY = 8
+
+
+# Multipart-upload tuning for writing processed results back to S3
+MULTIPART_PART_SIZE = 8 << 20  # 8 MB (S3 minimum is 5 MB)
+MULTIPART_CONCURRENCY = 4
+
+
+async def _stream_s3_body(body):
+    """
+    Yield chunks from a boto3 StreamingBody without loading it into memory.
+
+    Reads happen in a worker thread so the blocking socket reads don't
+    stall the event loop.
+    """
+    while chunk := await asyncio.to_thread(body.read, STREAM_CHUNK_SIZE):
+        yield chunk
+
+
+async def _stream_s3_ranges(key: str, content_length: int):
+    """
+    Yield an object's bytes in order while fetching ranges concurrently.
+
+    Splits the object into RANGED_CHUNK_SIZE ranges and keeps a sliding
+    window of at most RANGED_CONCURRENCY in-flight fetches, starting the
+    next one only once the oldest part has been yielded. A slow consumer
+    therefore bounds memory at the window, not the whole object, while
+    still seeing an ordinary ordered byte stream.
+    """
+    async def fetch_range(start: int, end: int) -> bytes:
+        response = await _s3_call(
+            s3_client.get_object,
+            Bucket=AWS_S3_BUCKET,
+            Key=key,
+            Range=f"bytes={start}-{end}"
+        )
+        return await asyncio.to_thread(response['Body'].read)
+
+    pending = deque()
+    try:
+        for start in range(0, content_length, RANGED_CHUNK_SIZE):
+            if len(pending) >= RANGED_CONCURRENCY:
+                yield await pending.popleft()
+            end = min(start + RANGED_CHUNK_SIZE, content_length) - 1
+            pending.append(asyncio.create_task(fetch_range(start, end)))
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+# Matches virtual-hosted (bucket.s3.region.amazonaws.com) and path-style
+# (s3.region.amazonaws.com/bucket/key) S3 endpoints
+_S3_HOST_RE = re.compile(r"(?:(?P<bucket>[^.]+)\.)?s3[.-](?:[^.]+\.)?amazonaws\.com$")
+
+
+def _parse_s3_url(url: str) -> Optional[tuple]:
+    """
+    Extract (bucket, key) from an S3 URL, or None if the host isn't S3.
+    """
+    parsed = urlparse(url)
+    match = _S3_HOST_RE.match(parsed.hostname or "")
+    if not match:
+        return None
+    path = unquote(parsed.path.lstrip("/"))
+    bucket = match.group("bucket")
+    if bucket:
+        return (bucket, path) if path else None
+    bucket, _, key = path.partition("/")
+    return (bucket, key) if bucket and key else None
+
+
+async def _multipart_upload_stream(chunks, output_key: str, content_type: str = 'text/csv'):
+    """
+    Upload an async byte stream to S3 as a multipart upload.
+
+    Buffers the stream into MULTIPART_PART_SIZE parts and submits up to
+    MULTIPART_CONCURRENCY upload_part calls in parallel. The semaphore is
+    acquired before a part task is created, so when S3 egress lags the
+    download the producer stops consuming the stream instead of queueing
+    buffered parts - peak memory stays bounded by a few parts instead of
+    the whole file.
+    """
+    create = await asyncio.to_thread(
+        s3_client.create_multipart_upload,
+        Bucket=AWS_S3_BUCKET,
+        Key=output_key,
+        ContentType=content_type
+    )
+    upload_id = create['UploadId']
+    semaphore = asyncio.Semaphore(MULTIPART_CONCURRENCY)
+    tasks = []
+
+    async def upload_part(part_number: int, data: bytes):
+        try:
+            part = await _s3_call(
+                s3_client.upload_part,
+                Bucket=AWS_S3_BUCKET,
+                Key=output_key,
+                PartNumber=part_number,
+                UploadId=upload_id,
+                Body=data
+            )
+            return {'PartNumber': part_number, 'ETag': part['ETag']}
+        finally:
+            semaphore.release()
+
+    async def start_part(part_number: int, data: bytes):
+        # Blocks until an upload slot frees before the task (and its part
+        # buffer) is created
+        await semaphore.acquire()
+        tasks.append(asyncio.create_task(upload_part(part_number, data)))
+
+    try:
+        buffer = bytearray()
+        part_number = 1
+        async for chunk in chunks:
+            buffer += chunk
+            while len(buffer) >= MULTIPART_PART_SIZE:
+                await start_part(part_number, bytes(buffer[:MULTIPART_PART_SIZE]))
+                del buffer[:MULTIPART_PART_SIZE]
+                part_number += 1
+
+        # Final (possibly empty) part; S3 requires at least one part
+        if buffer or part_number == 1:
+            await start_part(part_number, bytes(buffer))
+
+        parts = await asyncio.gather(*tasks)
+        await _s3_call(
+            s3_client.complete_multipart_upload,
+            Bucket=AWS_S3_BUCKET,
+            Key=output_key,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': list(parts)}
+        )
+    except Exception:
+        for task in tasks:
+            task.cancel()
+        await asyncio.to_thread(
+            s3_client.abort_multipart_upload,
+            Bucket=AWS_S3_BUCKET,
+            Key=output_key,
+            UploadId=upload_id
+        )
+        raise
+
+
+# msgspec parses and validates these small, hot schemas several times
+# faster than Pydantic model construction
+class FileImportRequest(msgspec.Struct):
     s3_key: str
     filename: str
 
 
-class S3FileImportRequest(BaseModel):
+class S3FileImportRequest(msgspec.Struct):
     s3_key: str
     filename: str
 
 
-class WebhookResponse(BaseModel):
+class WebhookResponse(msgspec.Struct):
     import_id: str
     status: str
-    data: Dict[str, Any] = None
-    errors: list = None
+    data: Optional[Dict[str, Any]] = None
+    errors: Optional[list] = None
+
+
+class WebhookData(msgspec.Struct):
+    id: str
+    status: Optional[str] = None
+    errors: Optional[list] = None
+
+
+class WebhookPayload(msgspec.Struct):
+    data: WebhookData
 
 
 
@@ -69,11 +369,20 @@ async def root():
 
 @app.post("/import-file")
 async def import_file(
-    request: S3FileImportRequest, background_tasks: BackgroundTasks
+    raw_request: Request, background_tasks: BackgroundTasks
 ):
     """
     Trigger a headless import from an S3 file
     """
+    # Decode the raw body with msgspec, skipping Pydantic model
+    # construction on the hot path
+    try:
+        request = msgspec.json.decode(
+            await raw_request.body(), type=S3FileImportRequest
+        )
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
     if not DROMO_LICENSE_KEY:
         raise HTTPException(
             status_code=500, detail="Dromo license key not configured"
@@ -87,67 +396,85 @@ async def import_file(
     try:
         # Step 1: Read file from S3
         try:
-            response = s3_client.get_object(Bucket=AWS_S3_BUCKET, Key=request.s3_key)
-            file_content = response['Body'].read()
-            logger.info(f"Successfully read file {request.s3_key} from S3 bucket {AWS_S3_BUCKET}")
+            # Run the blocking boto3 calls in worker threads so the S3
+            # round-trips don't stall the event loop
+            head = await _s3_call(
+                s3_client.head_object, Bucket=AWS_S3_BUCKET, Key=request.s3_key
+            )
+            content_length = head['ContentLength']
+
+            if content_length >= RANGED_DOWNLOAD_THRESHOLD:
+                file_stream = _stream_s3_ranges(request.s3_key, content_length)
+                logger.info(
+                    f"Opened file {request.s3_key} ({content_length} bytes) from S3 "
+                    f"bucket {AWS_S3_BUCKET} using {RANGED_CONCURRENCY} parallel ranged GETs"
+                )
+            else:
+                response = await _s3_call(
+                    s3_client.get_object, Bucket=AWS_S3_BUCKET, Key=request.s3_key
+                )
+                file_stream = _stream_s3_body(response['Body'])
+                logger.info(f"Opened file {request.s3_key} from S3 bucket {AWS_S3_BUCKET}")
         except NoCredentialsError:
             raise HTTPException(status_code=500, detail="AWS credentials not found")
         except BotoCoreError as e:
             raise HTTPException(status_code=500, detail=f"Error reading from S3: {str(e)}")
 
-        # Step 2: Create headless import
-        headers = {
-            "X-Dromo-License-Key": DROMO_LICENSE_KEY,
-            "Content-Type": "application/json"
-        }
-
+        # Step 2: Create headless import (json= sets Content-Type)
         create_payload = {
             "schema_id": DROMO_SCHEMA_ID,
             "original_filename": request.filename
         }
 
-        async with httpx.AsyncClient() as client:
-            # Create import
-            response = await client.post(
-                f"{DROMO_API_BASE}/headless/imports/",
-                json=create_payload,
-                headers=headers
-            )
-            response.raise_for_status()
-            import_data = response.json()
-            
-            logger.info(f"Dromo API response: {import_data}")
+        client = app.state.http
 
-            if "id" not in import_data:
-                raise ValueError(f"Missing 'id' in Dromo response: {import_data}")
-                
-            import_id = import_data["id"]
-            
-            # The upload URL might be under different keys
-            upload_url = None
-            for possible_key in ["upload_url", "upload", "uploadUrl", "file_upload_url"]:
-                if possible_key in import_data:
-                    upload_url = import_data[possible_key]
-                    break
-                    
-            if not upload_url:
-                raise ValueError(f"No upload URL found in Dromo response. Available keys: {list(import_data.keys())}")
-
-            # Step 3: Upload file to Dromo
-            upload_response = await client.put(
-                upload_url, content=file_content
-            )
-            upload_response.raise_for_status()
+        # Create import
+        response = await client.post(
+            f"{DROMO_API_BASE}/headless/imports/",
+            json=create_payload,
+            headers=_DROMO_HEADERS,
+            timeout=CONTROL_TIMEOUT
+        )
+        response.raise_for_status()
+        import_data = orjson.loads(response.content)
+
+        logger.info(f"Dromo API response: {import_data}")
 
-            logger.info(
-                f"Started import {import_id} for S3 file {request.s3_key}"
+        if "id" not in import_data:
+            raise ValueError(f"Missing 'id' in Dromo response: {import_data}")
+
+        import_id = import_data["id"]
+
+        # The upload URL might be under different keys; reuse the key
+        # discovered on the first call and only re-probe if it vanishes
+        global _UPLOAD_KEY
+        upload_url = import_data.get(_UPLOAD_KEY) if _UPLOAD_KEY else None
+        if upload_url is None:
+            _UPLOAD_KEY = next(
+                (k for k in _UPLOAD_KEYS if k in import_data), None
             )
+            if _UPLOAD_KEY is not None:
+                upload_url = import_data[_UPLOAD_KEY]
+
+        if not upload_url:
+            raise ValueError(f"No upload URL found in Dromo response. Available keys: {list(import_data.keys())}")
+
+        # Step 3: Stream the file from S3 to Dromo in chunks; httpx sends
+        # the async generator with Transfer-Encoding: chunked
+        upload_response = await client.put(
+            upload_url, content=file_stream, timeout=TRANSFER_TIMEOUT
+        )
+        upload_response.raise_for_status()
+
+        logger.info(
+            f"Started import {import_id} for S3 file {request.s3_key}"
+        )
 
-            return {
-                "import_id": import_id,
-                "status": "PENDING",
-                "message": "Import started successfully"
-            }
+        return {
+            "import_id": import_id,
+            "status": "PENDING",
+            "message": "Import started successfully"
+        }
 
     except httpx.HTTPStatusError as e:
         logger.error(
@@ -169,41 +496,77 @@ async def download_and_save_processed_data(import_id: str):
     Download processed data from Dromo using presigned URL and save to S3
     """
     try:
-        headers = {
-            "X-Dromo-License-Key": DROMO_LICENSE_KEY,
-        }
-
         # Get presigned download URL from Dromo
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            response = await client.get(
-                f"{DROMO_API_BASE}/upload/{import_id}/url/",
-                headers=headers
-            )
-            response.raise_for_status()
-            presigned_data = response.json()
-
-            download_url = presigned_data.get("presigned_url")
-            if not download_url:
-                raise ValueError(f"No presigned_url in response: {presigned_data}")
-
-            # Download the processed data
-            download_response = await client.get(download_url)
-            download_response.raise_for_status()
-            processed_data = download_response.content
+        client = app.state.http
+
+        # This endpoint returns JSON, not a redirect; only the presigned
+        # download itself opts into follow_redirects below
+        response = await _get_with_retry(
+            client,
+            f"{DROMO_API_BASE}/upload/{import_id}/url/",
+            headers=_DROMO_HEADERS,
+            timeout=CONTROL_TIMEOUT
+        )
+        presigned_data = orjson.loads(response.content)
 
-            # Create output filename
-            output_key = f"processed/{import_id}.csv"
+        download_url = presigned_data.get("presigned_url")
+        if not download_url:
+            raise ValueError(f"No presigned_url in response: {presigned_data}")
 
-            # Write to S3
-            s3_client.put_object(
-                Bucket=AWS_S3_BUCKET,
-                Key=output_key,
-                Body=processed_data,
-                ContentType='text/csv'
-            )
+        # Create output filename
+        output_key = f"processed/{import_id}.csv"
 
-            logger.info(f"Successfully downloaded and wrote processed data to S3: {output_key}")
-            return output_key
+        # If the presigned URL points at S3 and our credentials can read
+        # the source, copy server-side and skip round-tripping the bytes
+        # through this process entirely
+        source = _parse_s3_url(download_url)
+        if source is not None:
+            source_bucket, source_key = source
+            try:
+                await _s3_call(
+                    s3_client.copy_object,
+                    CopySource={'Bucket': source_bucket, 'Key': source_key},
+                    Bucket=AWS_S3_BUCKET,
+                    Key=output_key,
+                    ContentType='text/csv',
+                    MetadataDirective='REPLACE'
+                )
+                logger.info(f"Server-side copied processed data to S3: {output_key}")
+                return output_key
+            except (BotoCoreError, ClientError) as copy_error:
+                logger.warning(
+                    f"Server-side copy of {source_bucket}/{source_key} failed "
+                    f"({copy_error}); falling back to download"
+                )
+
+        # Stream the processed data to S3 without ever materializing the
+        # whole body: small results go through a spooled temp file into a
+        # single put_object, larger ones into a parallel multipart upload
+        async with client.stream(
+            'GET', download_url, follow_redirects=True, timeout=TRANSFER_TIMEOUT
+        ) as download_response:
+            download_response.raise_for_status()
+            content_length = int(download_response.headers.get('content-length', -1))
+
+            if 0 <= content_length < MULTIPART_PART_SIZE:
+                with tempfile.SpooledTemporaryFile(max_size=MULTIPART_PART_SIZE) as spool:
+                    async for chunk in download_response.aiter_bytes(STREAM_CHUNK_SIZE):
+                        spool.write(chunk)
+                    spool.seek(0)
+                    await asyncio.to_thread(
+                        s3_client.put_object,
+                        Bucket=AWS_S3_BUCKET,
+                        Key=output_key,
+                        Body=spool,
+                        ContentType='text/csv'
+                    )
+            else:
+                await _multipart_upload_stream(
+                    download_response.aiter_bytes(STREAM_CHUNK_SIZE), output_key
+                )
+
+        logger.info(f"Successfully downloaded and wrote processed data to S3: {output_key}")
+        return output_key
 
     except Exception as e:
         logger.error(f"Error downloading and saving processed data: {str(e)}")
@@ -211,25 +574,44 @@ async def download_and_save_processed_data(import_id: str):
 
 
 @app.post("/webhook")
-async def webhook_handler(webhook_data: Dict[str, Any]):
+async def webhook_handler(raw_request: Request):
     """
     Handle webhook notifications from Dromo and download processed data to S3
     """
     try:
-        # Extract data from the correct webhook structure
-        data = webhook_data.get("data", {})
-        import_id = data.get("id")
-        status = data.get("status")
-
-        if not import_id:
+        # Decode the payload into a typed struct in one pass; msgspec
+        # raises on a missing data.id instead of chained .get() probing
+        try:
+            webhook = msgspec.json.decode(
+                await raw_request.body(), type=WebhookPayload
+            )
+        except msgspec.DecodeError as e:
             raise HTTPException(
-                status_code=400, detail="Missing import_id in webhook data.data.id"
+                status_code=400, detail=f"Invalid webhook payload: {e}"
             )
 
+        import_id = webhook.data.id
+        status = webhook.data.status
+
         if status == "SUCCESSFUL":
             logger.info(f"Import {import_id} completed successfully")
 
-            # Download processed data from Dromo and save to S3
+            # Hand the Dromo->S3 copy off to the arq worker so the webhook
+            # returns immediately instead of holding Dromo's delivery open
+            # for the duration of the transfer
+            if app.state.arq is not None:
+                await app.state.arq.enqueue_job("process_import", import_id)
+                logger.info(f"Queued processing for import {import_id}")
+                return ORJSONResponse(
+                    status_code=202,
+                    content={
+                        "message": "Webhook queued",
+                        "import_id": import_id,
+                        "status": status,
+                    },
+                )
+
+            # No broker configured: download processed data inline
             try:
                 output_key = await download_and_save_processed_data(import_id)
                 logger.info(f"Successfully processed import {import_id} - data saved to S3: {output_key}")
@@ -237,7 +619,7 @@ async def webhook_handler(webhook_data: Dict[str, Any]):
                 logger.error(f"Failed to download processed data for import {import_id}: {str(download_error)}")
                 
         elif status == "FAILED":
-            logger.error(f"Import {import_id} failed: {data.get('errors')}")
+            logger.error(f"Import {import_id} failed: {webhook.data.errors}")
 
         return {"message": "Webhook processed successfully", "import_id": import_id, "status": status}
 
@@ -261,4 +643,14 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools shave per-request overhead off every keep-alive
+    # request; multiple workers parallelize across cores (requires the
+    # app as an import string)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
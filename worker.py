@@ -0,0 +1,35 @@
+"""
+arq worker that processes completed Dromo imports off the webhook path.
+
+Run alongside the API with:
+    arq worker.WorkerSettings
+"""
+import os
+
+from arq.connections import RedisSettings
+
+from main import app, build_http_client, download_and_save_processed_data
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+
+
+async def startup(ctx):
+    # The worker runs outside the FastAPI lifespan, so give it its own
+    # pooled HTTP client on the shared app.state handle
+    app.state.http = build_http_client()
+
+
+async def shutdown(ctx):
+    await app.state.http.aclose()
+
+
+async def process_import(ctx, import_id: str) -> str:
+    return await download_and_save_processed_data(import_id)
+
+
+class WorkerSettings:
+    functions = [process_import]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(REDIS_URL)
+    max_tries = 5